@@ -1,18 +1,33 @@
 import customtkinter as ctk
 from PIL import Image, ImageTk
 import requests
-from io import BytesIO
+import hashlib
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import queue
+import shutil
+import tempfile
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import subprocess
 import platform
 import json
+import pickle
+import re
 
 # Configuration
 ARCHIVE_ITEM = "zwallpaper"  # CHANGE THIS to your Archive.org item identifier
 ARCHIVE_BASE_URL = f"https://archive.org/download/{ARCHIVE_ITEM}/"
 
+# Verbose per-file logging (slow over a tty, so off by default)
+DEBUG = bool(os.environ.get("ZWALLPAPER_DEBUG"))
+
+# Precompiled filters for the metadata file loop
+_IMG_RE = re.compile(r'.+\.(jpe?g|png|webp|bmp)$', re.IGNORECASE)
+_SKIP_RE = re.compile(r'(_files\.xml|_meta\.xml|_meta\.sqlite|thumb)', re.IGNORECASE)
+
 # App directories
 HOME_DIR = Path.home()
 APP_DIR = HOME_DIR / ".zwallpaper"
@@ -26,15 +41,126 @@ CACHE_DIR.mkdir(exist_ok=True)
 THUMBNAILS_DIR.mkdir(exist_ok=True)
 WALLPAPERS_DIR.mkdir(exist_ok=True)
 
+# Stream downloads in 100 KiB chunks so we never hold a full wallpaper in RAM
+DOWNLOAD_CHUNK_SIZE = 100 * 1024
+
+# Shared session so every request reuses keep-alive connections to archive.org
+# instead of paying a fresh TCP+TLS handshake per thumbnail
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+
+# Two-stage pipeline: IO_POOL does streamed GETs while a single decoder
+# thread runs the heavy PIL work, so the download of card N+1 overlaps the
+# decode of card N without GIL ping-pong between a crowd of decode threads
+IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="io")
+
+# Decode jobs are (func, args) tuples drained one at a time
+DECODE_QUEUE = queue.Queue()
+
+
+def _decoder_loop():
+    """Run queued PIL decode jobs serially in a dedicated thread"""
+    while True:
+        func, args = DECODE_QUEUE.get()
+        try:
+            func(*args)
+        except Exception as e:
+            print(f"Error in decoder: {e}")
+        finally:
+            DECODE_QUEUE.task_done()
+
+
+threading.Thread(target=_decoder_loop, daemon=True, name="decoder").start()
+
+
+# In-flight downloads keyed by URL so concurrent callers (e.g. preview +
+# apply on the same wallpaper) coalesce on one transfer
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _stream_to_file(url, path, timeout):
+    """Stream a download straight to disk instead of buffering it in memory
+
+    Writes to a temp file next to the target and renames it into place on
+    success, so a dropped connection never leaves a truncated file that
+    exists() checks would mistake for a valid cached wallpaper.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=Path(path).parent, suffix=".part")
+    os.close(fd)
+    try:
+        with SESSION.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def download_to_file(url, path, timeout=30):
+    """Fetch url to path, deduplicating concurrent requests for the same URL"""
+    with _inflight_lock:
+        future = _inflight.get(url)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[url] = future
+
+    if owner:
+        # First caller does the transfer and publishes the written path
+        try:
+            _stream_to_file(url, path, timeout)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(path)
+        finally:
+            with _inflight_lock:
+                _inflight.pop(url, None)
+        return
+
+    # Another thread is already fetching this URL - wait for it and copy
+    written = future.result()
+    if Path(written) != Path(path):
+        shutil.copyfile(written, path)
+
+
+# Cached at import - platform.system() stats uname and DESKTOP_SESSION never
+# changes during a run, so don't pay for them on every apply
+_SYSTEM = platform.system()
+_DESKTOP = os.environ.get("DESKTOP_SESSION", "").lower()
+
+# KDE wallpaper script, filled in with the image path per apply
+_KDE_SCRIPT = (
+    'var allDesktops = desktops();'
+    'for (i=0;i<allDesktops.length;i++) {{'
+    'd = allDesktops[i];'
+    'd.wallpaperPlugin = "org.kde.image";'
+    'd.currentConfigGroup = Array("Wallpaper", "org.kde.image", "General");'
+    'd.writeConfig("Image", "file://{path}")}}'
+)
+
 
 class WallpaperManager:
     """Handles wallpaper setting for different platforms"""
-    
+
     @staticmethod
     def set_wallpaper(image_path):
         """Set wallpaper based on the operating system"""
-        system = platform.system()
-        
+        system = _SYSTEM
+
         try:
             if system == "Windows":
                 import ctypes
@@ -51,8 +177,8 @@ class WallpaperManager:
                 return True
             
             elif system == "Linux":
-                desktop = os.environ.get("DESKTOP_SESSION", "").lower()
-                
+                desktop = _DESKTOP
+
                 if "gnome" in desktop or "ubuntu" in desktop:
                     subprocess.run([
                         "gsettings", "set", "org.gnome.desktop.background",
@@ -62,7 +188,7 @@ class WallpaperManager:
                     subprocess.run([
                         "qdbus", "org.kde.plasmashell", "/PlasmaShell",
                         "org.kde.PlasmaShell.evaluateScript",
-                        f'var allDesktops = desktops();for (i=0;i<allDesktops.length;i++) {{d = allDesktops[i];d.wallpaperPlugin = "org.kde.image";d.currentConfigGroup = Array("Wallpaper", "org.kde.image", "General");d.writeConfig("Image", "file://{image_path}")}}'
+                        _KDE_SCRIPT.format(path=image_path)
                     ], check=True)
                 elif "xfce" in desktop:
                     subprocess.run([
@@ -90,8 +216,7 @@ class PreviewWindow(ctk.CTkToplevel):
         self.wallpaper_data = wallpaper_data
         self.on_apply_callback = on_apply_callback
         self.on_download_callback = on_download_callback
-        self.full_image = None
-        
+
         # Window setup
         self.title(f"Preview - {self.format_name(wallpaper_data['name'])}")
         self.geometry("1000x700")
@@ -214,38 +339,48 @@ class PreviewWindow(ctk.CTkToplevel):
         """Worker thread for loading image"""
         try:
             wallpaper_path = WALLPAPERS_DIR / self.wallpaper_data['name']
-            
-            # Check cache first
-            if wallpaper_path.exists():
-                image = Image.open(wallpaper_path)
-            else:
-                # Download image
-                response = requests.get(self.wallpaper_data['download_url'], timeout=30)
-                response.raise_for_status()
-                image = Image.open(BytesIO(response.content))
-            
-            # Store original for applying
-            self.full_image = image
-            
+
+            # Always land the raw bytes in the cache so apply/download can
+            # copy the file instead of re-encoding decoded pixels
+            if not wallpaper_path.exists():
+                download_to_file(self.wallpaper_data['download_url'], wallpaper_path)
+
+            image = Image.open(wallpaper_path)
+
+            # Capture the real resolution before draft() shrinks image.size
+            img_width, img_height = image.size
+
+            # Let libjpeg decode at reduced size before the final resample
+            if image.format == "JPEG":
+                image.draft("RGB", (1920, 1200))
+
             # Calculate size to fit in preview (max 960x600)
             max_width = 960
             max_height = 600
-            
-            img_width, img_height = image.size
-            ratio = min(max_width / img_width, max_height / img_height)
-            
-            new_width = int(img_width * ratio)
-            new_height = int(img_height * ratio)
-            
+
+            # Box-filter reduce() handles the power-of-two part cheaply so
+            # LANCZOS only resamples a near-target-size image
+            factor = max(1, min(image.size[0] // max_width, image.size[1] // max_height))
+            if factor >= 2:
+                image = image.reduce(factor)
+
+            ratio = min(max_width / image.size[0], max_height / image.size[1])
+
+            new_width = int(image.size[0] * ratio)
+            new_height = int(image.size[1] * ratio)
+
             preview_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
             
-            # Convert to CTkImage
+            # Convert to CTkImage - dark image only, the app forces dark mode
+            # and a second image would double CTk's internal resampling
             ctk_image = ctk.CTkImage(
-                light_image=preview_image,
                 dark_image=preview_image,
                 size=(new_width, new_height)
             )
-            
+
+            # Drop the full-resolution pixels; only the preview copy is needed
+            del image
+
             # Update UI
             self.after(0, lambda: self.display_image(ctk_image, img_width, img_height))
             
@@ -275,16 +410,10 @@ class PreviewWindow(ctk.CTkToplevel):
         """Worker thread for applying wallpaper"""
         try:
             wallpaper_path = WALLPAPERS_DIR / self.wallpaper_data['name']
-            
-            # Save if not cached
-            if not wallpaper_path.exists() and self.full_image:
-                self.full_image.save(wallpaper_path, quality=95)
-            elif not wallpaper_path.exists():
-                # Download if we don't have it
-                response = requests.get(self.wallpaper_data['download_url'], timeout=30)
-                response.raise_for_status()
-                with open(wallpaper_path, 'wb') as f:
-                    f.write(response.content)
+
+            # Download if we don't have it (preview load normally cached it)
+            if not wallpaper_path.exists():
+                download_to_file(self.wallpaper_data['download_url'], wallpaper_path)
             
             # Apply wallpaper
             success = WallpaperManager.set_wallpaper(wallpaper_path)
@@ -322,15 +451,13 @@ class PreviewWindow(ctk.CTkToplevel):
             downloads_folder.mkdir(exist_ok=True)
             
             download_path = downloads_folder / self.wallpaper_data['name']
-            
-            # Save image
-            if self.full_image:
-                self.full_image.save(download_path, quality=95)
+
+            # Copy the cached original when we have it - no re-download
+            cached = WALLPAPERS_DIR / self.wallpaper_data['name']
+            if cached.exists():
+                shutil.copyfile(cached, download_path)
             else:
-                response = requests.get(self.wallpaper_data['download_url'], timeout=30)
-                response.raise_for_status()
-                with open(download_path, 'wb') as f:
-                    f.write(response.content)
+                download_to_file(self.wallpaper_data['download_url'], download_path)
             
             self.after(0, lambda: self.download_btn.configure(
                 state="normal",
@@ -401,8 +528,8 @@ class WallpaperCard(ctk.CTkFrame):
         )
         self.preview_btn.pack(pady=(0, 10))
         
-        # Load thumbnail in background
-        threading.Thread(target=self.load_thumbnail, daemon=True).start()
+        # Thumbnail load is deferred until the card scrolls into view
+        self._future = None
     
     def format_name(self, filename):
         """Format filename to readable name"""
@@ -411,35 +538,103 @@ class WallpaperCard(ctk.CTkFrame):
             name = name.replace(res, '')
         name = name.replace('_', ' ').replace('-', ' ')
         return name.title()
-    
+
+    def rebind(self, wallpaper_data):
+        """Reuse this card for a different wallpaper instead of rebuilding it"""
+        if self._future is not None:
+            self._future.cancel()
+        self._future = None
+        self.wallpaper_data = wallpaper_data
+        self.thumbnail_image = None
+        self.image_label.configure(image="", text="Loading...")
+        self.name_label.configure(text=self.format_name(wallpaper_data['name']))
+
+    def start_loading(self):
+        """Kick off the thumbnail load once the card becomes visible"""
+        if self._future is None:
+            self._future = IO_POOL.submit(self.load_thumbnail)
+
     def load_thumbnail(self):
-        """Load thumbnail image"""
+        """I/O stage: fetch the image bytes, then hand off to the decode pool"""
         try:
-            thumb_path = THUMBNAILS_DIR / self.wallpaper_data['name']
-            
+            name = self.wallpaper_data['name']
+
+            # Key by name hash + size so a hit is just a tiny JPEG decode
+            key = hashlib.blake2b(name.encode(), digest_size=8).hexdigest()
+            thumb_path = THUMBNAILS_DIR / f"{key}_250x140.jpg"
+
             if thumb_path.exists():
-                image = Image.open(thumb_path)
+                DECODE_QUEUE.put((self.decode_thumbnail, (name, thumb_path, thumb_path)))
+            elif self.wallpaper_data.get('thumbnail_url'):
+                # Prefer the server-side derivative thumbnail (tens of KB)
+                # over the full wallpaper (tens of MB)
+                fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".img")
+                os.close(fd)
+                try:
+                    download_to_file(self.wallpaper_data['thumbnail_url'], tmp_path, timeout=10)
+                except Exception:
+                    os.unlink(tmp_path)
+                    raise
+                DECODE_QUEUE.put((self.decode_thumbnail,
+                                  (name, Path(tmp_path), thumb_path, True)))
+            else:
+                # No derivative: fetch the full file into the shared wallpaper
+                # cache so a concurrent preview load coalesces on one download
+                src_path = WALLPAPERS_DIR / name
+                if not src_path.exists():
+                    download_to_file(self.wallpaper_data['download_url'], src_path)
+                DECODE_QUEUE.put((self.decode_thumbnail, (name, src_path, thumb_path)))
+
+        except Exception as e:
+            print(f"Error loading thumbnail: {e}")
+            self.after(0, lambda: self.image_label.configure(text="Failed to load"))
+
+    def decode_thumbnail(self, name, src_path, thumb_path, remove_src=False):
+        """CPU stage: decode and resample, runs on the decoder thread"""
+        try:
+            image = Image.open(src_path)
+
+            if src_path == thumb_path:
+                # Cache hit: the file is already thumbnail-sized
+                image.load()
             else:
-                response = requests.get(self.wallpaper_data['download_url'], timeout=10)
-                response.raise_for_status()
-                image = Image.open(BytesIO(response.content))
-                
+                # Let libjpeg decode at reduced size before the final resample
+                if image.format == "JPEG":
+                    image.draft("RGB", (500, 280))
                 image.thumbnail((250, 140), Image.Resampling.LANCZOS)
+
+                # Letterbox to the exact card size (the label is fixed at
+                # 250x140) so a cache hit never needs another resample
+                card = Image.new("RGB", (250, 140), (26, 26, 26))
+                w, h = image.size
+                card.paste(image, ((250 - w) // 2, (140 - h) // 2))
+                image = card
+
                 image.save(thumb_path, "JPEG", quality=85)
-            
-            image = image.resize((250, 140), Image.Resampling.LANCZOS)
-            
+
+            # The card may have been rebound to another wallpaper meanwhile
+            if self.wallpaper_data['name'] != name:
+                return
+
+            # Dark image only - the app forces dark mode, and a second image
+            # would double CTk's internal resampling
             self.thumbnail_image = ctk.CTkImage(
-                light_image=image,
                 dark_image=image,
                 size=(250, 140)
             )
-            
+
             self.after(0, self.update_thumbnail)
-            
+
         except Exception as e:
             print(f"Error loading thumbnail: {e}")
             self.after(0, lambda: self.image_label.configure(text="Failed to load"))
+        finally:
+            # Remove the temp download whether or not the decode succeeded
+            if remove_src:
+                try:
+                    os.unlink(src_path)
+                except OSError:
+                    pass
     
     def update_thumbnail(self):
         """Update thumbnail in UI"""
@@ -471,12 +666,25 @@ class ZWallpaperApp(ctk.CTk):
         self.current_category = "all"
         self.all_wallpapers = []
         self.current_wallpaper = None
+        self.search_index = {}
+        self.cards = []
+        self.rows = []
+        self.no_results_label = None
+        self._search_after_id = None
+        self._display_generation = 0
         
         # Create UI
         self.create_ui()
-        
+
         # Load wallpapers
         self.load_wallpapers()
+
+        # Watch the viewport so only visible cards fetch their thumbnails
+        self.watch_viewport()
+
+        # Pool workers are non-daemon and would drain every queued download
+        # before letting the interpreter exit - cancel them on close
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def create_ui(self):
         """Create the user interface"""
@@ -582,69 +790,65 @@ class ZWallpaperApp(ctk.CTk):
             # Fetch metadata from Archive.org - correct endpoint
             metadata_url = f"https://archive.org/metadata/{ARCHIVE_ITEM}"
             print(f"Fetching from: {metadata_url}")
-            
-            response = requests.get(metadata_url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            print(f"Response keys: {data.keys() if isinstance(data, dict) else 'Not a dict'}")
-            
-            # Archive.org metadata structure: {"files": [...]}
-            if not isinstance(data, dict):
-                raise ValueError(f"Expected dict, got {type(data)}")
-            
-            files_data = data.get('files', [])
-            print(f"Number of files found: {len(files_data)}")
-            
-            if not files_data:
-                raise ValueError("No files found in Archive.org item. Make sure you uploaded wallpapers!")
-            
-            # Process each file
-            for file in files_data:
-                print(f"Processing file: {file.get('name', 'unknown')}")
-                name = file['name']
-                
-                # Skip non-image files and metadata files
-                if not name.lower().endswith(('.jpg', '.jpeg', '.png', '.webp', '.bmp')):
-                    print(f"Skipping non-image: {name}")
-                    continue
-                
-                # Skip Archive.org metadata files
-                if name.endswith('_files.xml') or name.endswith('_meta.xml') or name.endswith('_meta.sqlite'):
-                    print(f"Skipping metadata: {name}")
-                    continue
-                
-                # Extract category from path (e.g., "nature/sunset.jpg" -> "nature")
-                parts = name.split('/')
-                
-                if len(parts) > 1:
-                    category = parts[0]
-                    filename = parts[-1]
+
+            # Conditional GET: reuse the cached metadata when unchanged
+            metadata_path = CACHE_DIR / "metadata.json"
+            etag_path = CACHE_DIR / "metadata.etag"
+
+            headers = {}
+            if metadata_path.exists() and etag_path.exists():
+                headers["If-None-Match"] = etag_path.read_text().strip()
+
+            response = SESSION.get(metadata_url, headers=headers, timeout=10)
+
+            index_path = CACHE_DIR / "index.pkl"
+
+            index_loaded = False
+            if response.status_code == 304 and index_path.exists():
+                # Unchanged item: load the already-filtered index and skip
+                # the JSON parse and filter loop entirely
+                print("Metadata unchanged, loading pickled index")
+                try:
+                    with open(index_path, 'rb') as f:
+                        self.all_wallpapers, self.categories = pickle.load(f)
+                    index_loaded = True
+                except Exception as e:
+                    # A corrupt index must not brick loading forever - drop
+                    # it and fall back to re-parsing the cached metadata
+                    print(f"Discarding unreadable index: {e}")
+                    index_path.unlink(missing_ok=True)
+
+            if not index_loaded:
+                if response.status_code == 304:
+                    print("Metadata unchanged, using cached copy")
+                    data = json.loads(metadata_path.read_bytes())
                 else:
-                    category = 'uncategorized'
-                    filename = name
-                
-                # Skip thumbnail directories
-                if 'thumb' in category.lower() or 'thumb' in filename.lower():
-                    continue
-                
-                wallpaper_data = {
-                    'name': filename,
-                    'category': category,
-                    'download_url': f"{ARCHIVE_BASE_URL}{name}",
-                    'path': name,
-                    'size': file.get('size', 0)
-                }
-                
-                if category not in self.categories:
-                    self.categories[category] = []
-                
-                self.categories[category].append(wallpaper_data)
-                self.all_wallpapers.append(wallpaper_data)
-                print(f"Added wallpaper: {filename} in category: {category}")
-            
+                    response.raise_for_status()
+                    metadata_path.write_bytes(response.content)
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        etag_path.write_text(etag)
+                    data = response.json()
+
+                self.parse_metadata(data)
+
+                # Persist the filtered result so the next unchanged launch
+                # skips JSON parsing and filtering; write via temp file +
+                # rename so a crash mid-dump can't truncate the index
+                fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".pkl")
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((self.all_wallpapers, self.categories), f, protocol=5)
+                os.replace(tmp_path, index_path)
+
             print(f"\nTotal wallpapers loaded: {len(self.all_wallpapers)}")
             print(f"Categories: {list(self.categories.keys())}")
+
+            # Pre-lower names once so searching doesn't allocate per keystroke
+            self.search_index = {
+                "all": [(w, w['name'].lower()) for w in self.all_wallpapers]
+            }
+            for category, items in self.categories.items():
+                self.search_index[category] = [(w, w['name'].lower()) for w in items]
             
             # Update UI on main thread
             self.after(0, self.populate_categories)
@@ -657,7 +861,67 @@ class ZWallpaperApp(ctk.CTk):
             import traceback
             traceback.print_exc()
             self.after(0, lambda msg=error_msg: self.update_status(f"Error: {msg}"))
-    
+
+    def parse_metadata(self, data):
+        """Parse the Archive.org metadata dict into wallpaper lists"""
+        print(f"Response keys: {data.keys() if isinstance(data, dict) else 'Not a dict'}")
+
+        # Archive.org metadata structure: {"files": [...]}
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected dict, got {type(data)}")
+
+        files_data = data.get('files', [])
+        print(f"Number of files found: {len(files_data)}")
+
+        if not files_data:
+            raise ValueError("No files found in Archive.org item. Make sure you uploaded wallpapers!")
+
+        # Archive.org generates small derivative thumbnails for most
+        # items; map original filename -> derivative URL so the grid can
+        # fetch tens of KB instead of the full wallpaper
+        thumb_formats = {"Item Tile", "Thumbnail", "JPEG Thumb"}
+        derivative_thumbs = {}
+        for file in files_data:
+            if file.get('format') in thumb_formats and file.get('original'):
+                derivative_thumbs[file['original']] = f"{ARCHIVE_BASE_URL}{file['name']}"
+
+        # Process each file
+        for file in files_data:
+            name = file['name']
+
+            # One regex pass filters non-images, metadata files and thumbs
+            if not _IMG_RE.match(name) or _SKIP_RE.search(name):
+                if DEBUG:
+                    print(f"Skipping: {name}")
+                continue
+
+            # Extract category from path (e.g., "nature/sunset.jpg" -> "nature")
+            parts = name.split('/')
+
+            if len(parts) > 1:
+                category = parts[0]
+                filename = parts[-1]
+            else:
+                category = 'uncategorized'
+                filename = name
+
+            wallpaper_data = {
+                'name': filename,
+                'category': category,
+                'download_url': f"{ARCHIVE_BASE_URL}{name}",
+                'thumbnail_url': derivative_thumbs.get(name),
+                'path': name,
+                'size': file.get('size', 0)
+            }
+
+            if category not in self.categories:
+                self.categories[category] = []
+
+            self.categories[category].append(wallpaper_data)
+            self.all_wallpapers.append(wallpaper_data)
+            if DEBUG:
+                print(f"Added wallpaper: {filename} in category: {category}")
+
     def populate_categories(self):
         """Populate category buttons in sidebar"""
         # Remove old category buttons (except "All")
@@ -697,36 +961,90 @@ class ZWallpaperApp(ctk.CTk):
             self.category_buttons[category] = btn
     
     def display_wallpapers(self, wallpapers=None):
-        """Display wallpapers in grid"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
+        """Display wallpapers in grid, recycling existing cards"""
         if wallpapers is None:
             wallpapers = self.all_wallpapers
-        
+
+        if self.no_results_label:
+            self.no_results_label.pack_forget()
+
+        # A newer rebuild invalidates any batch emission still pending
+        self._display_generation += 1
+
+        for row in self.rows:
+            row.pack_forget()
+
         if not wallpapers:
-            no_results = ctk.CTkLabel(
-                self.scrollable_frame,
-                text="No wallpapers found",
-                font=("Arial", 16)
-            )
-            no_results.pack(pady=50)
+            if self.no_results_label is None:
+                self.no_results_label = ctk.CTkLabel(
+                    self.scrollable_frame,
+                    text="No wallpapers found",
+                    font=("Arial", 16)
+                )
+            self.no_results_label.pack(pady=50)
             return
-        
-        # Create grid
-        current_row = None
-        for i, wallpaper in enumerate(wallpapers):
-            if i % 3 == 0:  # 3 columns
-                current_row = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
-                current_row.pack(fill="x", padx=10, pady=5)
-            
-            card = WallpaperCard(
-                current_row,
-                wallpaper,
-                self.show_preview
-            )
-            card.pack(side="left", fill="both", expand=True)
+
+        self.emit_card_batch(wallpapers, 0, self._display_generation)
+
+    def emit_card_batch(self, wallpapers, start, generation):
+        """Build or rebind up to 12 cards, then yield to the event loop
+
+        Emitting the grid in after_idle batches keeps Tk pumping paint and
+        input events while a large catalog is laid out.
+        """
+        if generation != self._display_generation:
+            return
+
+        end = min(start + 12, len(wallpapers))
+
+        # Rebind existing cards and grow the pool only when needed -
+        # widget creation is far more expensive than reconfiguring
+        for i in range(start, end):
+            if i >= len(self.cards):
+                if i % 3 == 0:  # 3 columns
+                    row = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+                    self.rows.append(row)
+                card = WallpaperCard(
+                    self.rows[i // 3],
+                    wallpapers[i],
+                    self.show_preview
+                )
+                self.cards.append(card)
+            else:
+                self.cards[i].rebind(wallpapers[i])
+            self.cards[i].pack(side="left", fill="both", expand=True)
+            self.rows[i // 3].pack(fill="x", padx=10, pady=5)
+
+        if end < len(wallpapers):
+            self.after_idle(self.emit_card_batch, wallpapers, end, generation)
+            return
+
+        # Final batch: hide surplus cards from the previous view
+        for card in self.cards[len(wallpapers):]:
+            if card._future is not None:
+                card._future.cancel()
+            card.pack_forget()
+
+        # Start loads for whatever ended up in the viewport
+        self.after_idle(self.load_visible_thumbnails)
+
+    def load_visible_thumbnails(self):
+        """Start thumbnail loads for cards currently inside the viewport"""
+        canvas = self.scrollable_frame._parent_canvas
+        top = canvas.winfo_rooty()
+        bottom = top + canvas.winfo_height()
+
+        for card in self.cards:
+            if card._future is not None or not card.winfo_ismapped():
+                continue
+            y = card.winfo_rooty()
+            if y + card.winfo_height() >= top and y <= bottom:
+                card.start_loading()
+
+    def watch_viewport(self):
+        """Periodically check which cards scrolled into view"""
+        self.load_visible_thumbnails()
+        self.after(250, self.watch_viewport)
     
     def show_category(self, category):
         """Show wallpapers from specific category"""
@@ -746,26 +1064,30 @@ class ZWallpaperApp(ctk.CTk):
             self.display_wallpapers(self.categories.get(category, []))
     
     def on_search(self, event=None):
-        """Handle search input"""
+        """Debounce search input so fast typing doesn't rebuild the grid per key"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self.run_search)
+
+    def run_search(self):
+        """Filter wallpapers by the current search query"""
+        self._search_after_id = None
         query = self.search_entry.get().lower()
         
         if not query:
             self.show_category(self.current_category)
             return
-        
-        # Filter wallpapers
-        if self.current_category == "all":
-            wallpapers = self.all_wallpapers
-        else:
-            wallpapers = self.categories.get(self.current_category, [])
-        
-        filtered = [w for w in wallpapers if query in w['name'].lower()]
+
+        # Filter against the pre-lowered names
+        index = self.search_index.get(self.current_category, [])
+        filtered = [w for w, name in index if query in name]
         self.display_wallpapers(filtered)
     
     def refresh_wallpapers(self):
         """Refresh wallpaper list from Archive.org"""
         self.categories.clear()
         self.all_wallpapers.clear()
+        self.search_index.clear()
         self.load_wallpapers()
     
     def show_preview(self, wallpaper_data):
@@ -790,6 +1112,11 @@ class ZWallpaperApp(ctk.CTk):
         """Update status bar message"""
         self.status_label.configure(text=message)
 
+    def on_close(self):
+        """Drop queued downloads so closing the window exits immediately"""
+        IO_POOL.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
 
 def main():
     """Main entry point"""